@@ -393,17 +393,12 @@ class TextTable:
         return "\n".join(self.render_lines())
 
     def is_col_colspan(self, col):
-        for row in self.rows:
-            if col < len(row):
-                if row[col].pseudo() or row[col].colspan > 1:
-                    return True
-        return False
+        return any(row[col].pseudo() or row[col].colspan > 1
+                   for row in self.rows if col < len(row))
 
     def is_row_colspan(self, row):
-        for column in self[row].columns:
-            if column.pseudo() or column.colspan > 1:
-                    return True
-        return False
+        return any(column.pseudo() or column.colspan > 1
+                   for column in self[row].columns)
 
     def assert_not_col_colspan(self, col):
         check_condition(self.is_col_colspan(col) is False,
@@ -647,6 +642,16 @@ class TableDriver:
         raise TableException("Syntax {0} doesn't support insert single line "
                              "and move".format(self.syntax.name))
 
+    def _insert_hline_and_move(self, table, table_pos, hline_row):
+        table.rows.insert(table_pos.row_num + 1, hline_row)
+        # add the empty row before packing, so the table is packed once
+        if (table_pos.row_num + 2 >= len(table)
+                or table[table_pos.row_num + 2].is_separator()):
+            table.rows.insert(table_pos.row_num + 2, DataRow(table))
+        table.pack()
+        return("Single separator row inserted",
+               TablePos(table_pos.row_num + 2, 0))
+
     def editor_align(self, table, table_pos):
         return ("Table aligned",
                 TablePos(table_pos.row_num, table_pos.field_num))
@@ -780,7 +785,7 @@ class BaseTableParser:
     def columns_match_regex(self, str_cols, regex):
         if len(str_cols) == 0:
             return False
-        return all(re.match(regex, col) for col in str_cols)
+        return all(regex.match(col) for col in str_cols)
 
     def parse_text(self, text):
         table = TextTable(self.syntax)
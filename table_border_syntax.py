@@ -26,8 +26,6 @@
 from __future__ import print_function
 from __future__ import division
 
-import re
-
 try:
     from . import table_base as tbase
 except ValueError:
@@ -55,13 +53,15 @@ class SeparatorRow(tbase.Row):
         return True
 
     def render(self):
-        r = self.syntax.hline_out_border
+        out_border = self.syntax.hline_out_border
+        in_border = self.syntax.hline_in_border
+        parts = [out_border]
         for ind, column in enumerate(self.columns):
             if ind != 0:
-                r += self.syntax.hline_in_border
-            r += column.render()
-        r += self.syntax.hline_out_border
-        return r
+                parts.append(in_border)
+            parts.append(column.render())
+        parts.append(out_border)
+        return ''.join(parts)
 
 
 class SeparatorColumn(tbase.Column):
@@ -92,31 +92,32 @@ class BorderTableDriver(tbase.TableDriver):
                 tbase.TablePos(table_pos.row_num, table_pos.field_num))
 
     def editor_insert_hline_and_move(self, table, table_pos):
-        table.rows.insert(table_pos.row_num + 1, SeparatorRow(table, '-'))
-        table.pack()
-        if table_pos.row_num + 2 < len(table):
-            if table[table_pos.row_num + 2].is_separator():
-                table.insert_empty_row(table_pos.row_num + 2)
-        else:
-            table.insert_empty_row(table_pos.row_num + 2)
-        return("Single separator row inserted",
-               tbase.TablePos(table_pos.row_num + 2, 0))
+        return self._insert_hline_and_move(table, table_pos,
+                                           SeparatorRow(table, '-'))
 
 
 class BorderTableParser(tbase.BaseTableParser):
 
-    def _is_single_row_separator(self, str_cols):
-        return self.columns_match_regex(str_cols, r"^\s*[-]+\s*$")
-
-    def _is_double_row_separator(self, str_cols):
-        return self.columns_match_regex(str_cols, r"^\s*[=]+\s*$")
+    def _row_separator(self, texts):
+        # '-' or '=' if all cell texts are ' --- ' or all are ' === ',
+        # None otherwise, including when texts is empty
+        separator = None
+        for cell_text in texts:
+            text = cell_text.strip()
+            if separator is None:
+                separator = text[:1]
+                if separator not in ('-', '='):
+                    return None
+            if len(text) == 0 or text.count(separator) != len(text):
+                return None
+        return separator
 
     def create_row(self, table, line):
-        str_cols = line.str_cols()
-        if self._is_single_row_separator(str_cols):
-            row = SeparatorRow(table, '-')
-        elif self._is_double_row_separator(str_cols):
-            row = SeparatorRow(table, '=')
+        # lazy, so data rows are rejected at the first cell without
+        # building the full str_cols() list
+        separator = self._row_separator(cell.text for cell in line.cells)
+        if separator is not None:
+            row = SeparatorRow(table, separator)
         else:
             row = self.create_data_row(table, line)
         return row
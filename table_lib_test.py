@@ -363,6 +363,19 @@ class SimpleSyntaxTest(BaseTableTest):
         self.assertEqual(tbase.TablePos(1, 0), pos)
         self.assert_table_equals(expected, t.render())
 
+    def testDetectSeparator(self):
+        text = """
+| Name | Age |
+|------|-----|
+|======|=====|
+|------|=====|
+|------|     |
+        """.strip()
+
+        t = self.syntax.table_parser.parse_text(text)
+        self.assertEqual([False, True, True, False, False],
+                         [row.is_separator() for row in t.rows])
+
     def testParseCsv(self):
         csv_text = """
 a,b,c
@@ -576,6 +589,52 @@ class MultiMarkdownSyntaxTest(BaseTableTest):
                 formatted = t.render()
                 self.assert_table_equals(expected, formatted)
 
+    def testInsertHlineAndMoveAtLastRow(self):
+        text = """
+|  Name | Age |
+| ----- | --- |
+| Alisa |  21 |
+| Alex  |  22 |
+        """.strip()
+
+        expected = """
+|  Name | Age |
+| ----- | --- |
+| Alisa |  21 |
+| Alex  |  22 |
+| ----- | --- |
+|       |     |
+        """.strip()
+
+        t = self.syntax.table_parser.parse_text(text)
+        d = self.syntax.table_driver
+        msg, pos = d.editor_insert_hline_and_move(t, tbase.TablePos(3, 1))
+        self.assertEqual(tbase.TablePos(5, 0), pos)
+        self.assert_table_equals(expected, t.render())
+
+    def testInsertHlineAndMoveAboveSeparator(self):
+        text = """
+|  Name | Age |
+| Alisa |  21 |
+| ----- | --- |
+| Alex  |  22 |
+        """.strip()
+
+        expected = """
+|  Name | Age |
+| Alisa |  21 |
+| ----- | --- |
+|       |     |
+| ----- | --- |
+| Alex  |  22 |
+        """.strip()
+
+        t = self.syntax.table_parser.parse_text(text)
+        d = self.syntax.table_driver
+        msg, pos = d.editor_insert_hline_and_move(t, tbase.TablePos(1, 1))
+        self.assertEqual(tbase.TablePos(3, 0), pos)
+        self.assert_table_equals(expected, t.render())
+
     text = """
 
 """
@@ -53,18 +53,30 @@ class MultiMarkdownTableSyntax(tbase.TableSyntax):
 
 class MultiMarkdownAlignColumn(tbase.Column):
     PATTERN = r"^\s*([:]?[-]+[:]?)\s*$"
+    PATTERN_RE = re.compile(PATTERN)
+
+    # indexed by (starts with ':') << 1 | (ends with ':')
+    ALIGN_LUT = (None,
+                 tbase.Column.ALIGN_RIGHT,
+                 tbase.Column.ALIGN_LEFT,
+                 tbase.Column.ALIGN_CENTER)
+
+    # alignment -> (lead, trail)
+    MARKER_MAP = {tbase.Column.ALIGN_CENTER: (':', ':'),
+                  tbase.Column.ALIGN_LEFT: (':', '-'),
+                  tbase.Column.ALIGN_RIGHT: ('-', ':'),
+                  None: ('-', '-')}
 
     def __init__(self, row, data):
         tbase.Column.__init__(self, row)
         col = data.strip()
-        if col.count(':') == 2:
-            self._align_follow = tbase.Column.ALIGN_CENTER
-        elif col[0] == ':':
-            self._align_follow = tbase.Column.ALIGN_LEFT
-        elif col[-1] == ':':
-            self._align_follow = tbase.Column.ALIGN_RIGHT
+        if col:
+            self._align_follow = MultiMarkdownAlignColumn.ALIGN_LUT[
+                (col[0] == ':') << 1 | (col[-1] == ':')]
         else:
             self._align_follow = None
+        self._lead, self._trail = MultiMarkdownAlignColumn.MARKER_MAP[
+            self._align_follow]
 
     def min_len(self):
         return int(math.ceil(self.total_min_len() / self.colspan))
@@ -74,22 +86,11 @@ class MultiMarkdownAlignColumn(tbase.Column):
         return 5 + self.colspan - 1
 
     def render(self):
-        total_col_len = self.col_len + sum([col.col_len for col in self.pseudo_columns])
-
-        if self._align_follow == tbase.Column.ALIGN_CENTER:
-            lead = ':'
-            trail = ':'
-        elif self._align_follow == tbase.Column.ALIGN_LEFT:
-            lead = ':'
-            trail = '-'
-        elif self._align_follow == tbase.Column.ALIGN_RIGHT:
-            lead = '-'
-            trail = ':'
-        else:
-            lead = '-'
-            trail = '-'
+        total_col_len = self.col_len
+        for col in self.pseudo_columns:
+            total_col_len += col.col_len
 
-        return ' ' + lead + '-' * (total_col_len - 4) + trail + ' '
+        return ' ' + self._lead + '-' * (total_col_len - 4) + self._trail + ' '
 
     def align_follow(self):
         return self._align_follow
@@ -115,11 +116,10 @@ class MultiMarkdownAlignRow(tbase.Row):
 
 class MultiMarkdownTableParser(tbase.BaseTableParser):
 
-    def _is_multi_markdown_align_row(self, str_cols):
-        return self.columns_match_regex(str_cols, MultiMarkdownAlignColumn.PATTERN)
-
     def create_row(self, table, line):
-        if self._is_multi_markdown_align_row(line.str_cols()):
+        str_cols = line.str_cols()
+        if self.columns_match_regex(str_cols,
+                                    MultiMarkdownAlignColumn.PATTERN_RE):
             row = MultiMarkdownAlignRow(table)
         else:
             row = tbase.DataRow(table)
@@ -141,12 +141,5 @@ class MultiMarkdownTableDriver(tbase.TableDriver):
                 tbase.TablePos(table_pos.row_num, table_pos.field_num))
 
     def editor_insert_hline_and_move(self, table, table_pos):
-        table.rows.insert(table_pos.row_num + 1, MultiMarkdownAlignRow(table))
-        table.pack()
-        if table_pos.row_num + 2 < len(table):
-            if table[table_pos.row_num + 2].is_separator():
-                table.insert_empty_row(table_pos.row_num + 2)
-        else:
-            table.insert_empty_row(table_pos.row_num + 2)
-        return("Single separator row inserted",
-               tbase.TablePos(table_pos.row_num + 2, 0))
+        return self._insert_hline_and_move(
+            table, table_pos, MultiMarkdownAlignRow(table))
@@ -65,10 +65,12 @@ class CustomAlignColumn(tbase.Column):
                  '#': tbase.Column.ALIGN_CENTER}
 
     PATTERN = r"^\s*((?:[\<]+)|(?:[\>]+)|(?:[\#]+))\s*$"
+    PATTERN_RE = re.compile(PATTERN)
 
     def __init__(self, row, data):
         tbase.Column.__init__(self, row)
-        self.align_char = re.search(r"[\<]|[\>]|[\#]", data).group(0)
+        # data matches PATTERN, so it is a run of a single align char
+        self.align_char = data.strip()[0]
 
     def align_follow(self):
         return CustomAlignColumn.ALIGN_MAP[self.align_char]
@@ -96,7 +98,7 @@ class CustomAlignRow(tbase.Row):
 class SimpleTableParser(tborder.BorderTableParser):
 
     def _is_custom_align_row(self, str_cols):
-        return self.columns_match_regex(str_cols, CustomAlignColumn.PATTERN)
+        return self.columns_match_regex(str_cols, CustomAlignColumn.PATTERN_RE)
 
     def create_row(self, table, line):
         if (self.syntax.custom_column_alignment and
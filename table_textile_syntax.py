@@ -120,12 +120,8 @@ class TextileRow(tbase.Row):
         return not self.is_header_separator()
 
     def is_header_separator(self):
-        for column in self.columns:
-            if not isinstance(column, TextileCellColumn):
-                return False
-            if '_' not in column.attr:
-                return False
-        return True
+        return all(isinstance(column, TextileCellColumn) and '_' in column.attr
+                   for column in self.columns)
 
 
 class TextileTableParser(tbase.BaseTableParser):